@@ -2,9 +2,10 @@
 """Codex client with OpenAI Responses API compatibility using new Rust-based codex CLI."""
 
 import os
+import shutil
 import subprocess
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -116,7 +117,8 @@ class ChatCompletions:
 
         try:
             # Run codex CLI
-            result = subprocess.run(
+            run = self.parent.run_fn or subprocess.run
+            result = run(
                 cmd, capture_output=True, text=True, timeout=use_timeout, check=True, cwd=self.parent.working_dir
             )
 
@@ -250,6 +252,8 @@ class CodexClient:
         model: str | None = None,
         sandbox_mode: str | None = None,
         approval_policy: str | None = None,
+        run_fn: Callable[..., Any] | None = None,
+        which_fn: Callable[[str], str | None] | None = None,
     ):
         """Initialize the Codex client.
 
@@ -261,7 +265,11 @@ class CodexClient:
             model: Default model to use (e.g., "gpt-4o", "o1-preview", "o3")
             sandbox_mode: Sandbox policy (read-only, workspace-write, danger-full-access)
             approval_policy: Approval policy (untrusted, on-failure, never)
+            run_fn: Replacement for subprocess.run (defaults to subprocess.run)
+            which_fn: Replacement for shutil.which used to locate the CLI
         """
+        self.run_fn = run_fn
+        self.which_fn = which_fn
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.codex_path = codex_path or self._find_codex_cli()
         self.working_dir = working_dir or os.getcwd()
@@ -280,9 +288,8 @@ class CodexClient:
     def _find_codex_cli(self) -> str:
         """Find the new Rust-based codex CLI in PATH or common locations."""
         # Check if codex is in PATH
-        import shutil
-
-        codex_path = shutil.which("codex")
+        which = self.which_fn or shutil.which
+        codex_path = which("codex")
         if codex_path:
             return codex_path
 
@@ -302,7 +309,7 @@ class CodexClient:
                 return path
 
         # Check if old node-based codex exists and warn
-        old_codex = shutil.which("codex-old") or shutil.which("codex-node")
+        old_codex = which("codex-old") or which("codex-node")
         if old_codex:
             msg = (
                 "Found old Node.js-based codex CLI, but claif_cod now requires "
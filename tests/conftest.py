@@ -0,0 +1,148 @@
+"""Shared pytest fixtures for the claif_cod test suite."""
+
+import asyncio
+import os
+import sys
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where it is available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+# Shared duck-typed transport; cheaper than rebuilding a MagicMock per test.
+_TRANSPORT_TEMPLATE = SimpleNamespace(connect=AsyncMock(), disconnect=AsyncMock(), send_query=AsyncMock())
+
+
+@pytest.fixture
+def mock_transport():
+    """Return the shared mock transport, reset after each test."""
+    yield _TRANSPORT_TEMPLATE
+    for mock in vars(_TRANSPORT_TEMPLATE).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def client():
+    """Create a client instance."""
+    from claif_cod.client import CodexClient
+
+    return CodexClient()
+
+
+@pytest.fixture
+def fake_path_cls():
+    """Return a factory for Path subclasses where only the given paths exist.
+
+    Patch a module's ``Path`` name with the result (or build paths from it) instead of
+    patching ``pathlib.Path.exists`` for the whole process.
+    """
+
+    def _make(*existing):
+        existing = {str(path) for path in existing}
+
+        class _Path(type(Path())):
+            def exists(self, *args, **kwargs):
+                return str(self) in existing
+
+        return _Path
+
+    return _make
+
+
+@pytest.fixture
+def mock_codex_run():
+    """Return a stand-in for subprocess.run to inject into clients as ``run_fn``."""
+    return MagicMock(return_value=SimpleNamespace(returncode=0, stdout="", stderr=""))
+
+
+_FAKE_CODEX_SCRIPT = """\
+#!{python}
+# Stand-in for the codex CLI: accepts any arguments and prints a canned reply.
+print("Test successful: 1, 2, 3")
+"""
+
+
+@pytest.fixture
+def fake_codex(tmp_path, monkeypatch):
+    """Put a fake ``codex`` executable first on PATH and return its path."""
+    if sys.platform == "win32":
+        pytest.skip("fake codex shim needs a POSIX shebang")
+    codex = tmp_path / "codex"
+    codex.write_text(_FAKE_CODEX_SCRIPT.format(python=sys.executable))
+    codex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    return codex
+
+
+def _make_codex_client(**kwargs):
+    """Construct a CodexClient without probing the filesystem for the CLI."""
+    from claif_cod.client import CodexClient
+
+    kwargs.setdefault("codex_path", "/usr/bin/codex")
+    return CodexClient(**kwargs)
+
+
+@pytest.fixture
+def codex_client(mock_codex_run):
+    """Return a default OpenAI-compatible client running codex through mock_codex_run."""
+    return _make_codex_client(run_fn=mock_codex_run)
+
+
+@pytest.fixture
+def codex_client_factory(mock_codex_run):
+    """Return a callable building clients with custom constructor arguments."""
+    return partial(_make_codex_client, run_fn=mock_codex_run)
+
+
+@pytest.fixture
+def cli():
+    """Create a CLI instance."""
+    from claif_cod.cli import CodexCLI
+
+    return CodexCLI()
+
+
+@pytest.fixture
+def mock_query():
+    """Mock the query function used by the CLI."""
+    with patch("claif_cod.cli.query") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_print():
+    """Mock CLI print functions."""
+    with patch("claif_cod.cli._print") as p, patch("claif_cod.cli._print_error") as pe:
+        with patch("claif_cod.cli._print_success") as ps:
+            with patch("claif_cod.cli._print_warning") as pw:
+                yield {"print": p, "error": pe, "success": ps, "warning": pw}
+
+
+@pytest.fixture
+def _no_sleep(monkeypatch):
+    """Make retry backoff waits instant."""
+
+    async def _sleep(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr("asyncio.sleep", _sleep)
+
+
+@pytest.fixture
+def _reset_client_singleton(monkeypatch):
+    """Start the test without a cached module-level client."""
+    monkeypatch.setattr("claif_cod.client._client", None)
@@ -0,0 +1,26 @@
+"""Benchmarks for claif_cod hot paths.
+
+Run with ``hatch run test:bench``. Under the default ``-n auto`` run pytest-benchmark
+disables timing and each benchmark executes once as a plain test.
+"""
+
+import pytest
+
+# A long alternating conversation the client folds into one prompt on every call
+_MESSAGES = [
+    {"role": "user" if i % 2 == 0 else "assistant", "content": f"Message {i}: write a helper function"}
+    for i in range(100)
+]
+
+
+@pytest.mark.benchmark(group="chat_completions", min_rounds=50)
+def test_bench_create_sync(benchmark, codex_client, mock_codex_run):
+    """Benchmark a non-streaming completion with the codex subprocess stubbed out."""
+    mock_codex_run.return_value.stdout = "Generated code response"
+
+    response = benchmark(codex_client.chat.completions.create, model="o4-mini", messages=_MESSAGES)
+
+    assert response.choices[0].message.content == "Generated code response"
+    # The prompt is the last user message followed by the assistant reply after it
+    prompt = mock_codex_run.call_args[0][0][-1]
+    assert prompt.startswith(_MESSAGES[-2]["content"])